@@ -1,17 +1,18 @@
 """Main Textual application for deploy status dashboard."""
 
 import asyncio
+from datetime import datetime, timezone
 from typing import Optional
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
+from textual.timer import Timer
 from textual.widgets import Static, Footer, Header
-from textual.css.query import NoMatches
 
-from .models import App as AppModel, get_apps, Status
+from .models import App as AppModel, get_apps
 import webbrowser
-from .github import fetch_app_status, open_github_run
+from .github import create_client, fetch_app_health, fetch_app_status, fetch_failure_logs, open_github_run
 from .widgets import AppCard, DetailView
 
 
@@ -36,7 +37,19 @@ class DeployStatusApp(App):
         super().__init__()
         self.apps: list[AppModel] = []
         self.selected_app: Optional[AppModel] = None
+        self._cards: dict[str, AppCard] = {}
+        self._detail_view: Optional[DetailView] = None
+        self._resize_timer: Optional[Timer] = None
+        # Layout containers, looked up once on mount
+        self._grid: Optional[Container] = None
+        self._apps_panel: Optional[Vertical] = None
+        self._detail_panel: Optional[Vertical] = None
         self._refresh_task: Optional[asyncio.Task] = None
+        self._logs_task: Optional[asyncio.Task] = None
+        # One pooled HTTP/2 client for every GitHub call and health check
+        self.http = create_client()
+        # Limit how many apps are fetched at once
+        self._sem = asyncio.Semaphore(8)
 
     def compose(self) -> ComposeResult:
         """Compose the app layout."""
@@ -59,117 +72,137 @@ class DeployStatusApp(App):
     async def on_mount(self) -> None:
         """Handle app mount - start loading data."""
         self.apps = get_apps()
+        self._grid = self.query_one("#apps-grid")
+        self._apps_panel = self.query_one("#apps-panel")
+        self._detail_panel = self.query_one("#detail-panel")
         await self._create_cards()
         self._update_grid_columns()
         self._refresh_task = asyncio.create_task(self._load_all_status())
 
+    async def on_unmount(self) -> None:
+        """Stop any running refresh or log fetch and close the shared HTTP client."""
+        for task in (self._refresh_task, self._logs_task):
+            if task and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        await self.http.aclose()
+
     def on_resize(self) -> None:
-        """Handle terminal resize."""
-        self._update_grid_columns()
+        """Handle terminal resize (once a burst of resize events settles)."""
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(0.05, self._update_grid_columns)
 
     def _update_grid_columns(self) -> None:
         """Update grid columns based on terminal width."""
-        try:
-            grid = self.query_one("#apps-grid")
-            apps_panel = self.query_one("#apps-panel")
+        if self._grid is None or self._apps_panel is None:
+            return
 
-            # Get available width (accounting for padding/borders)
-            available_width = self.size.width - 4
+        # Get available width (accounting for padding/borders)
+        available_width = self.size.width - 4
 
-            # If detail panel is open, use less width
-            if "with-detail" in apps_panel.classes:
-                available_width = int(available_width * 0.35)
+        # If detail panel is open, use less width
+        if "with-detail" in self._apps_panel.classes:
+            available_width = int(available_width * 0.35)
 
-            # Each card needs ~22 chars minimum (including borders/gaps)
-            card_width = 24
-            columns = max(1, available_width // card_width)
+        # Each card needs ~22 chars minimum (including borders/gaps)
+        card_width = 24
+        columns = max(1, available_width // card_width)
 
-            # Cap at reasonable max
-            columns = min(columns, 6)
+        # Cap at reasonable max
+        columns = min(columns, 6)
 
-            grid.styles.grid_size_columns = columns
-        except Exception:
-            pass
+        # Only touch the styles (and trigger a layout) when it changes
+        if self._grid.styles.grid_size_columns != columns:
+            self._grid.styles.grid_size_columns = columns
 
     async def _create_cards(self) -> None:
         """Create app cards."""
-        grid = self.query_one("#apps-grid")
         for app in self.apps:
-            card = AppCard(app, id=f"card-{app.name.lower().replace(' ', '-')}")
-            await grid.mount(card)
-
-    async def _load_all_status(self) -> None:
-        """Load status for all apps progressively."""
-        tasks = []
-        for app in self.apps:
-            task = asyncio.create_task(self._load_app_status(app))
-            tasks.append(task)
-            # Small delay between starting fetches to avoid rate limiting
-            await asyncio.sleep(0.2)
-
+            card = AppCard(app, id=app.card_id)
+            self._cards[app.name] = card
+            await self._grid.mount(card)
+
+    async def _load_all_status(self, revalidate: bool = False) -> None:
+        """Load status for all apps progressively.
+
+        ``revalidate`` is set for refreshes the user asks for, so they never
+        get cached data without checking it's current.
+        """
+        # Health checks hit the apps' own hosts, so they run alongside the
+        # GitHub fetches (outside the semaphore) without holding up the cards
+        now = datetime.now(timezone.utc)
+        tasks = [asyncio.create_task(self._load_app_status(app, now, revalidate)) for app in self.apps]
+        tasks += [asyncio.create_task(self._load_app_health(app, revalidate)) for app in self.apps]
         await asyncio.gather(*tasks, return_exceptions=True)
 
-    async def _load_app_status(self, app: AppModel) -> None:
+    async def _load_app_status(self, app: AppModel, now: datetime, revalidate: bool = False) -> None:
         """Load status for a single app and update its card."""
         try:
-            await fetch_app_status(app)
+            async with self._sem:
+                await fetch_app_status(self.http, app, revalidate)
         except Exception:
             app.loading = False
 
         # Update the card
-        card_id = f"card-{app.name.lower().replace(' ', '-')}"
-        try:
-            card = self.query_one(f"#{card_id}", AppCard)
-            card.update_app(app)
+        card = self._cards.get(app.name)
+        if card is not None:
+            card.update_app(app, now)
 
             # If this app is selected, update detail view too
             if self.selected_app and self.selected_app.name == app.name:
                 self.selected_app = app
                 self._update_detail_view()
-        except NoMatches:
-            pass
+                self._load_selected_logs()
+
+    async def _load_app_health(self, app: AppModel, revalidate: bool = False) -> None:
+        """Run health checks for a single app and show them if it's selected."""
+        await fetch_app_health(self.http, app, revalidate)
+        if self._detail_view is not None and self.selected_app is app:
+            self._detail_view.update_health_display()
 
     def _update_detail_view(self) -> None:
         """Update the detail view with current selected app."""
         if not self.selected_app:
             return
 
-        detail_panel = self.query_one("#detail-panel")
-
-        # Remove old detail view if exists
-        for child in detail_panel.children:
-            child.remove()
-
-        # Add new detail view
-        detail_view = DetailView(self.selected_app)
-        detail_panel.mount(detail_view)
+        # Mount the detail view once, then just update it
+        if self._detail_view is None:
+            self._detail_view = DetailView(self.selected_app)
+            self._detail_panel.mount(self._detail_view)
+        else:
+            self._detail_view.update_app(self.selected_app)
 
     def on_app_card_selected(self, message: AppCard.Selected) -> None:
         """Handle app card selection."""
         self.selected_app = message.app_data
         self._show_detail_panel()
         self._update_detail_view()
+        self._load_selected_logs()
+
+    def _load_selected_logs(self) -> None:
+        """Fetch error logs for the selected app in the background."""
+        # A fetch still running belongs to an earlier selection (or refresh)
+        if self._logs_task and not self._logs_task.done():
+            self._logs_task.cancel()
+        self._logs_task = asyncio.create_task(self._lazy_load_logs(self.selected_app))
+
+    async def _lazy_load_logs(self, app: AppModel) -> None:
+        """Fetch error logs for an app's failed builds and refresh its detail view."""
+        if await fetch_failure_logs(self.http, app) and self.selected_app is app:
+            self._update_detail_view()
 
     def _show_detail_panel(self) -> None:
         """Show the detail panel."""
-        detail_panel = self.query_one("#detail-panel")
-        detail_panel.add_class("visible")
-        apps_panel = self.query_one("#apps-panel")
-        apps_panel.add_class("with-detail")
+        self._detail_panel.add_class("visible")
+        self._apps_panel.add_class("with-detail")
         self._update_grid_columns()
 
     def _hide_detail_panel(self) -> None:
         """Hide the detail panel."""
-        detail_panel = self.query_one("#detail-panel")
-        detail_panel.remove_class("visible")
-        apps_panel = self.query_one("#apps-panel")
-        apps_panel.remove_class("with-detail")
+        self._detail_panel.remove_class("visible")
+        self._apps_panel.remove_class("with-detail")
         self.selected_app = None
-
-        # Remove detail view content
-        for child in detail_panel.children:
-            child.remove()
-
         self._update_grid_columns()
 
     def on_detail_view_close_requested(self, message: DetailView.CloseRequested) -> None:
@@ -183,40 +216,18 @@ class DeployStatusApp(App):
 
     def action_refresh(self) -> None:
         """Refresh all app statuses."""
-        # Reset all apps to loading state
-        for app in self.apps:
-            app.loading = True
-            app.dev.status = Status.LOADING
-            app.prod.status = Status.LOADING
-            for workflow in app.dev.workflows:
-                workflow.status = Status.LOADING
-            for workflow in app.prod.workflows:
-                workflow.status = Status.LOADING
-
-        # Update cards to show loading state
-        for app in self.apps:
-            card_id = f"card-{app.name.lower().replace(' ', '-')}"
-            try:
-                card = self.query_one(f"#{card_id}", AppCard)
-                card.update_app(app)
-            except NoMatches:
-                pass
-
-        # Update detail view to show loading if open
-        if self.selected_app:
-            # Find the updated app object
-            for app in self.apps:
-                if app.name == self.selected_app.name:
-                    self.selected_app = app
-                    break
-            self._update_detail_view()
+        # Keep showing the current status (dimmed) until each app's new data
+        # comes in; the card and detail view update when its fetch completes
+        for card in self._cards.values():
+            card.add_class("refreshing")
 
-        # Cancel existing refresh if running
+        # Cancel existing refresh if running (cancelling its gather cancels
+        # every per-app fetch, so stale results can't overwrite new ones)
         if self._refresh_task and not self._refresh_task.done():
             self._refresh_task.cancel()
 
         # Start new refresh
-        self._refresh_task = asyncio.create_task(self._load_all_status())
+        self._refresh_task = asyncio.create_task(self._load_all_status(revalidate=True))
 
     def action_open_github(self) -> None:
         """Open the selected app's GitHub Actions in browser."""
@@ -242,7 +253,7 @@ class DeployStatusApp(App):
         # Try prod URL first, then dev
         for env in [self.selected_app.prod, self.selected_app.dev]:
             if env.url:
-                webbrowser.open(f"https://{env.url}")
+                webbrowser.open(env.full_url)
                 return
 
     def action_select_card(self) -> None:
@@ -1,279 +1,394 @@
 """GitHub API client for fetching workflow status."""
 
 import asyncio
+import functools
+import os
+import random
 import subprocess
+import time
+import webbrowser
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    # Python 3.11+ handles the trailing "Z" itself
+    _parse_iso = datetime.fromisoformat
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 from .models import App, BranchComparison, BranchCompareConfig, Commit, Environment, Release, Status, Workflow
 
 
+API_URL = "https://api.github.com"
+
+# How long (seconds) a cached response is used before revalidating it
+RUNS_TTL = 15
+COMMITS_TTL = 30
+RELEASES_TTL = 300
+HEALTH_TTL = 15
+
+# Number of pending commits shown per branch comparison
+COMPARE_COMMITS = 5
+
+# Commit fields requested from the GraphQL API
+_GRAPHQL_COMMIT = "oid messageHeadline author { name date }"
+
+# Retries for rate limited or failed requests, and the longest wait for one
+MAX_RETRIES = 3
+MAX_RETRY_WAIT = 60
+
+# URL -> (fetched_at, etag, data)
+_cache: dict[str, tuple[float, str, Any]] = {}
+
+# Workflow name -> ID, per repo. Workflow IDs never change, so look them up once.
+_workflow_ids: dict[str, dict[str, int]] = {}
+
+# App name -> (fetched_at, data) for the GraphQL git info query
+_git_info_cache: dict[str, tuple[float, dict]] = {}
+
+# URL -> (checked_at, (health_ok, health_code, health_latency_ms, health_error))
+_health_cache: dict[str, tuple[float, tuple]] = {}
+
+# Job ID -> error log lines. A finished job's log never changes.
+_log_cache: dict[int, list[str]] = {}
+
+# Job conclusions that count as a failed build. When a job fails, its
+# siblings are often cancelled, so "failure" is looked for first.
+FAILED_CONCLUSIONS = ("failure", "timed_out", "startup_failure", "cancelled")
+
+# Marker GitHub Actions puts on error annotations in job logs
+ERROR_MARKER = "##[error]"
+
+
+@functools.lru_cache(maxsize=1)
+def get_token() -> Optional[str]:
+    """Get a GitHub token from the environment or the gh CLI (fetched once)."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def create_client() -> httpx.AsyncClient:
+    """Create the HTTP client shared by all GitHub and health check requests."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=10.0,
+        follow_redirects=True,
+    )
+
+
+def _api_headers() -> dict[str, str]:
+    """Headers for GitHub API requests (only sent to api.github.com)."""
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    token = get_token()
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """How long to wait before retrying a response, or None if it shouldn't be retried."""
+    status = response.status_code
+    headers = response.headers
+
+    if status in (403, 429):
+        if headers.get("Retry-After", "").isdigit():
+            return float(headers["Retry-After"])
+        if headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset", "").isdigit():
+            return max(0.0, int(headers["X-RateLimit-Reset"]) - time.time()) + 1
+        if status == 403:
+            return None
+
+    if status == 429 or status >= 500:
+        return 2 ** attempt + random.random()
+
+    return None
+
+
+async def gh_request(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    **kwargs,
+) -> httpx.Response:
+    """Send a GitHub API request, waiting out rate limits and retrying server errors."""
+    for attempt in range(MAX_RETRIES):
+        response = await client.request(method, url, headers=headers, **kwargs)
+        delay = _retry_delay(response, attempt)
+        # Don't block a refresh for long if the rate limit resets much later
+        if delay is None or delay > MAX_RETRY_WAIT:
+            return response
+        await asyncio.sleep(delay)
+
+    return await client.request(method, url, headers=headers, **kwargs)
+
+
+async def cached_get(
+    client: httpx.AsyncClient,
+    path: str,
+    params: Optional[dict] = None,
+    ttl: float = RUNS_TTL,
+    revalidate: bool = False,
+) -> Optional[Any]:
+    """GET a GitHub API path and return the decoded JSON, or None on error.
+
+    Responses are cached per URL. Within ``ttl`` seconds the cached body is
+    returned without a request, unless ``revalidate`` is set (the user asked
+    for a refresh). Otherwise it is revalidated with its ETag, and a 304
+    (which doesn't count against the rate limit) reuses it.
+    """
+    url = str(httpx.URL(f"{API_URL}/{path}", params=params))
+    cached = _cache.get(url)
+    if cached and not revalidate and time.monotonic() - cached[0] < ttl:
+        return cached[2]
+
+    headers = _api_headers()
+    if cached and cached[1]:
+        headers["If-None-Match"] = cached[1]
+
+    response = await gh_request(client, "GET", url, headers)
+    if response.status_code == 304 and cached:
+        _cache[url] = (time.monotonic(), cached[1], cached[2])
+        return cached[2]
+    if response.status_code != 200:
+        return None
+
+    # Decode the raw bytes directly (no str decode step with orjson)
+    data = _loads(response.content)
+    _cache[url] = (time.monotonic(), response.headers.get("ETag", ""), data)
+    return data
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp from the API, or None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return _parse_iso(value)
+    except ValueError:
+        return None
+
+
+def _parse_run(run: dict) -> dict:
+    """Convert a workflow run from the API into a status result."""
+    status_str = run.get("status", "")
+    conclusion = run.get("conclusion", "")
+
+    # Parse time
+    time = _parse_time(run.get("created_at"))
+    end_time = _parse_time(run.get("updated_at"))
+    duration = None
+    if time and end_time:
+        duration = int((end_time - time).total_seconds())
+
+    # Determine status
+    if status_str == "completed":
+        status = Status.SUCCESS if conclusion == "success" else Status.FAILURE
+    elif status_str in ("in_progress", "queued", "waiting"):
+        status = Status.RUNNING
+    else:
+        status = Status.NONE
+
+    return {
+        "status": status,
+        "run_id": run.get("id"),
+        "time": time,
+        "duration_seconds": duration,
+        "actor": (run.get("actor") or {}).get("login", ""),
+    }
+
+
 async def fetch_workflow_status(
     client: httpx.AsyncClient,
     repo: str,
     branch: str,
     workflow_name: Optional[str] = None,
+    revalidate: bool = False,
 ) -> dict:
     """Fetch the latest workflow run status from GitHub API."""
     if not repo or not branch:
         return {"status": Status.NONE}
 
     try:
-        # Build API URL with query params
-        api_path = f"repos/{repo}/actions/runs?branch={branch}&per_page=1"
-        if workflow_name:
-            # Need to get workflow ID first or filter by name after
-            pass
-
-        jq_filter = '.workflow_runs[0] | {id, status, conclusion, created_at, updated_at, actor: .actor.login, workflow_name: .name}'
-
-        cmd = ["gh", "api", api_path, "--jq", jq_filter]
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        data = await cached_get(
+            client,
+            f"repos/{repo}/actions/runs",
+            {"branch": branch, "per_page": 1},
+            revalidate=revalidate,
         )
-        stdout, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
-            return {"status": Status.NONE, "error": stderr.decode()}
-
-        import json
-        output = stdout.decode().strip()
-        if not output or output == "null":
+        if not data or not data.get("workflow_runs"):
             return {"status": Status.NONE}
 
-        run = json.loads(output)
-
-        status_str = run.get("status", "")
-        conclusion = run.get("conclusion", "")
-        created_at = run.get("created_at", "")
-        updated_at = run.get("updated_at", "")
-        run_id = run.get("id")
-        actor = run.get("actor", "")
+        run = data["workflow_runs"][0]
 
         # If workflow_name specified, verify it matches
-        if workflow_name and run.get("workflow_name") != workflow_name:
-            # Fallback to gh run list for specific workflow
-            return await _fetch_workflow_status_by_name(repo, branch, workflow_name)
-
-        # Parse time
-        time = None
-        duration = None
-        if created_at:
-            try:
-                time = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                if updated_at:
-                    end_time = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-                    duration = int((end_time - time).total_seconds())
-            except ValueError:
-                pass
-
-        # Determine status
-        if status_str == "completed":
-            status = Status.SUCCESS if conclusion == "success" else Status.FAILURE
-        elif status_str in ("in_progress", "queued", "waiting"):
-            status = Status.RUNNING
-        else:
-            status = Status.NONE
-
-        return {
-            "status": status,
-            "run_id": run_id,
-            "time": time,
-            "duration_seconds": duration,
-            "actor": actor,
-        }
+        if workflow_name and run.get("name") != workflow_name:
+            # Fallback to the runs of that specific workflow
+            return await _fetch_workflow_status_by_name(client, repo, branch, workflow_name, revalidate)
+
+        return _parse_run(run)
 
     except Exception as e:
         return {"status": Status.NONE, "error": str(e)}
 
 
-async def _fetch_workflow_status_by_name(repo: str, branch: str, workflow_name: str) -> dict:
+async def _fetch_workflow_id(client: httpx.AsyncClient, repo: str, workflow_name: str) -> Optional[int]:
+    """Look up a workflow's ID by its name."""
+    if repo not in _workflow_ids:
+        data = await cached_get(client, f"repos/{repo}/actions/workflows", {"per_page": 100})
+        if not data:
+            return None
+        _workflow_ids[repo] = {w["name"]: w["id"] for w in data.get("workflows", [])}
+
+    return _workflow_ids[repo].get(workflow_name)
+
+
+async def _fetch_workflow_status_by_name(
+    client: httpx.AsyncClient,
+    repo: str,
+    branch: str,
+    workflow_name: str,
+    revalidate: bool = False,
+) -> dict:
     """Fetch workflow status for a specific workflow name."""
     try:
-        cmd = [
-            "gh", "run", "list",
-            "-R", repo,
-            "--branch", branch,
-            "--workflow", workflow_name,
-            "-L", "1",
-            "--json", "status,conclusion,createdAt,databaseId,updatedAt",
-        ]
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
+        workflow_id = await _fetch_workflow_id(client, repo, workflow_name)
+        if not workflow_id:
             return {"status": Status.NONE}
 
-        import json
-        data = json.loads(stdout.decode())
-
-        if not data:
+        data = await cached_get(
+            client,
+            f"repos/{repo}/actions/workflows/{workflow_id}/runs",
+            {"branch": branch, "per_page": 1},
+            revalidate=revalidate,
+        )
+        if not data or not data.get("workflow_runs"):
             return {"status": Status.NONE}
 
-        run = data[0]
-        run_id = run.get("databaseId")
-
-        # Get actor from API
-        actor = ""
-        if run_id:
-            actor_cmd = ["gh", "api", f"repos/{repo}/actions/runs/{run_id}", "--jq", ".actor.login"]
-            actor_proc = await asyncio.create_subprocess_exec(
-                *actor_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            actor_stdout, _ = await actor_proc.communicate()
-            if actor_proc.returncode == 0:
-                actor = actor_stdout.decode().strip()
-
-        status_str = run.get("status", "")
-        conclusion = run.get("conclusion", "")
-        created_at = run.get("createdAt", "")
-        updated_at = run.get("updatedAt", "")
-
-        time = None
-        duration = None
-        if created_at:
-            try:
-                time = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                if updated_at:
-                    end_time = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-                    duration = int((end_time - time).total_seconds())
-            except ValueError:
-                pass
-
-        if status_str == "completed":
-            status = Status.SUCCESS if conclusion == "success" else Status.FAILURE
-        elif status_str in ("in_progress", "queued", "waiting"):
-            status = Status.RUNNING
-        else:
-            status = Status.NONE
-
-        return {
-            "status": status,
-            "run_id": run_id,
-            "time": time,
-            "duration_seconds": duration,
-            "actor": actor,
-        }
+        return _parse_run(data["workflow_runs"][0])
 
     except Exception:
         return {"status": Status.NONE}
 
 
-async def fetch_error_logs(repo: str, run_id: int, max_lines: int = 500) -> list[str]:
-    """Fetch error logs for a failed run."""
+async def fetch_error_logs(client: httpx.AsyncClient, repo: str, job_id: int, max_lines: int = 500) -> list[str]:
+    """Fetch the last lines of a failed job's log, up to its last error."""
+    if job_id in _log_cache:
+        return _log_cache[job_id]
+
     try:
-        cmd = [
-            "gh", "run", "view",
-            str(run_id),
-            "-R", repo,
-            "--log-failed",
-        ]
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        # Redirects to a short-lived download URL; httpx drops the auth
+        # header when following it to another host
+        response = await gh_request(
+            client, "GET", f"{API_URL}/repos/{repo}/actions/jobs/{job_id}/logs", _api_headers()
         )
-        stdout, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
+        if response.status_code != 200:
             return []
 
-        lines = stdout.decode().strip().split("\n")
-        return lines[-max_lines:] if len(lines) > max_lines else lines
+        lines = response.text.strip().split("\n")
+
+        # Cut off whatever ran after the last error (cleanup steps etc.)
+        for end in range(len(lines), 0, -1):
+            if ERROR_MARKER in lines[end - 1]:
+                lines = lines[:end]
+                break
+
+        lines = lines[-max_lines:] if len(lines) > max_lines else lines
+        _log_cache[job_id] = lines
+        return lines
 
     except Exception:
         return []
 
 
-async def fetch_failed_job_id(repo: str, run_id: int) -> Optional[int]:
-    """Fetch the job ID of the first failed job in a run."""
+async def fetch_failed_job_id(
+    client: httpx.AsyncClient,
+    repo: str,
+    run_id: int,
+    revalidate: bool = False,
+) -> Optional[int]:
+    """Fetch the job ID of the first failed job in a run (its latest attempt).
+
+    A job that timed out or was cancelled counts too, as the run shows as
+    failed either way.
+    """
     try:
-        cmd = [
-            "gh", "api",
-            f"repos/{repo}/actions/runs/{run_id}/jobs",
-            "--jq", '[.jobs[] | select(.conclusion == "failure")][0].id'
-        ]
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
+        data = await cached_get(client, f"repos/{repo}/actions/runs/{run_id}/jobs", revalidate=revalidate)
+        if not data:
             return None
 
-        output = stdout.decode().strip()
-        if output and output != "null":
-            return int(output)
+        jobs = data.get("jobs", [])
+        for conclusion in FAILED_CONCLUSIONS:
+            for job in jobs:
+                if job.get("conclusion") == conclusion:
+                    return job.get("id")
         return None
 
     except Exception:
         return None
 
 
-async def fetch_latest_commit(repo: str, branch: str) -> Optional[Commit]:
+async def fetch_latest_commit(
+    client: httpx.AsyncClient,
+    repo: str,
+    branch: str,
+    revalidate: bool = False,
+) -> Optional[Commit]:
     """Fetch the latest commit for a branch."""
     if not repo or not branch:
         return None
 
     try:
-        cmd = [
-            "gh", "api",
-            f"repos/{repo}/commits/{branch}",
-            "--jq", '{sha: .sha[0:7], message: .commit.message, author: .commit.author.name, date: .commit.author.date}',
-        ]
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
+        data = await cached_get(client, f"repos/{repo}/commits/{branch}", ttl=COMMITS_TTL, revalidate=revalidate)
+        if not data:
             return None
 
-        import json
-        data = json.loads(stdout.decode())
-
-        # Parse date
-        commit_date = None
-        if data.get("date"):
-            try:
-                commit_date = datetime.fromisoformat(data["date"].replace("Z", "+00:00"))
-            except ValueError:
-                pass
+        commit = data.get("commit", {})
+        author = commit.get("author") or {}
 
         # Truncate message to first line and limit length
-        message = data.get("message", "").split("\n")[0][:60]
+        message = commit.get("message", "").split("\n")[0][:60]
 
         return Commit(
-            sha=data.get("sha", ""),
+            sha=data.get("sha", "")[:7],
             message=message,
-            author=data.get("author", ""),
-            date=commit_date,
+            author=author.get("name", ""),
+            date=_parse_time(author.get("date")),
         )
 
     except Exception:
         return None
 
 
-async def fetch_branch_comparison(repo: str, config: BranchCompareConfig) -> BranchComparison:
+async def fetch_branch_comparison(
+    client: httpx.AsyncClient,
+    repo: str,
+    config: BranchCompareConfig,
+    revalidate: bool = False,
+) -> BranchComparison:
     """Fetch comparison between two branches."""
     comparison = BranchComparison(base=config.base, head=config.head)
 
@@ -281,43 +396,42 @@ async def fetch_branch_comparison(repo: str, config: BranchCompareConfig) -> Bra
         return comparison
 
     try:
-        cmd = [
-            "gh", "api",
-            f"repos/{repo}/compare/{config.base}...{config.head}",
-            "--jq", '{ahead_by, behind_by, commits: [.commits[-5:][] | {sha: .sha[0:7], message: .commit.message, author: .commit.author.name, date: .commit.author.date}]}',
-        ]
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
+        path = f"repos/{repo}/compare/{config.base}...{config.head}"
+        data = await cached_get(client, path, {"per_page": COMPARE_COMMITS}, ttl=COMMITS_TTL, revalidate=revalidate)
+        if not data:
             return comparison
 
-        import json
-        data = json.loads(stdout.decode())
-
         comparison.ahead_by = data.get("ahead_by", 0)
         comparison.behind_by = data.get("behind_by", 0)
 
-        # Parse commits
-        for c in data.get("commits", []):
-            commit_date = None
-            if c.get("date"):
-                try:
-                    commit_date = datetime.fromisoformat(c["date"].replace("Z", "+00:00"))
-                except ValueError:
-                    pass
-
-            message = c.get("message", "").split("\n")[0][:50]
+        commits = data.get("commits", [])
+        total = data.get("total_commits", len(commits))
+        if total > COMPARE_COMMITS:
+            # Commits are listed oldest first, so the newest are on the last
+            # page (plus the one before it when the last page isn't full)
+            last_page = -(-total // COMPARE_COMMITS)
+            first_page = max(1, last_page - 1) if total % COMPARE_COMMITS else last_page
+            pages = await asyncio.gather(*[
+                cached_get(
+                    client, path, {"per_page": COMPARE_COMMITS, "page": page},
+                    ttl=COMMITS_TTL, revalidate=revalidate,
+                )
+                for page in range(max(2, first_page), last_page + 1)
+            ])
+            commits = (commits if first_page == 1 else []) + [
+                c for page in pages if page for c in page.get("commits", [])
+            ]
+
+        # Parse the last few commits
+        for c in commits[-COMPARE_COMMITS:]:
+            commit = c.get("commit", {})
+            author = commit.get("author") or {}
+            message = commit.get("message", "").split("\n")[0][:50]
             comparison.commits.append(Commit(
-                sha=c.get("sha", ""),
+                sha=c.get("sha", "")[:7],
                 message=message,
-                author=c.get("author", ""),
-                date=commit_date,
+                author=author.get("name", ""),
+                date=_parse_time(author.get("date")),
             ))
 
         return comparison
@@ -326,65 +440,118 @@ async def fetch_branch_comparison(repo: str, config: BranchCompareConfig) -> Bra
         return comparison
 
 
-async def fetch_environment_status(env: Environment) -> Environment:
+def _apply_run_result(target: Environment | Workflow, result: dict) -> None:
+    """Copy a workflow status result onto an environment or workflow."""
+    run_id = result.get("run_id")
+    if run_id != target.run_id:
+        # Logs and failed job belong to the previous run
+        target.error_lines = []
+        target.job_id = None
+
+    target.status = result.get("status", Status.NONE)
+    target.run_id = run_id
+    target.time = result.get("time")
+    target.duration_seconds = result.get("duration_seconds")
+    target.actor = result.get("actor")
+
+
+def _failed_runs(env: Environment) -> list[Environment | Workflow]:
+    """Get the environment's (or its workflows') failed runs."""
+    targets = env.workflows if env.has_workflows else [env]
+    return [t for t in targets if t.status == Status.FAILURE and t.run_id]
+
+
+async def fetch_environment_status(
+    client: httpx.AsyncClient,
+    env: Environment,
+    revalidate: bool = False,
+) -> Environment:
     """Fetch status for an environment."""
     if not env.repo:
         env.status = Status.NONE
         return env
 
+    # Fetch every workflow at once (the latest commit comes from fetch_git_info)
     if env.has_workflows:
-        # Fetch each workflow separately
-        for workflow in env.workflows:
-            result = await fetch_workflow_status(
-                None, workflow.repo, workflow.branch, workflow.name
-            )
-            workflow.status = result.get("status", Status.NONE)
-            workflow.run_id = result.get("run_id")
-            workflow.time = result.get("time")
-            workflow.duration_seconds = result.get("duration_seconds")
-            workflow.actor = result.get("actor")
-
-            if workflow.status == Status.FAILURE and workflow.run_id:
-                workflow.error_lines = await fetch_error_logs(
-                    workflow.repo, workflow.run_id
-                )
-                workflow.job_id = await fetch_failed_job_id(
-                    workflow.repo, workflow.run_id
-                )
+        results = await asyncio.gather(*[
+            fetch_workflow_status(client, workflow.repo, workflow.branch, workflow.name, revalidate)
+            for workflow in env.workflows
+        ])
+        for workflow, result in zip(env.workflows, results):
+            _apply_run_result(workflow, result)
+        env.latest_time = max((w.time for w in env.workflows if w.time), default=None)
     else:
-        result = await fetch_workflow_status(None, env.repo, env.branch)
-        env.status = result.get("status", Status.NONE)
-        env.run_id = result.get("run_id")
-        env.time = result.get("time")
-        env.duration_seconds = result.get("duration_seconds")
-        env.actor = result.get("actor")
+        result = await fetch_workflow_status(client, env.repo, env.branch, revalidate=revalidate)
+        _apply_run_result(env, result)
+
+    # Failed job IDs are cheap and needed for the error link; logs are
+    # fetched later, only for the app the user opens (fetch_failure_logs)
+    failed = _failed_runs(env)
+    job_ids = await asyncio.gather(*[
+        fetch_failed_job_id(client, target.repo, target.run_id, revalidate)
+        for target in failed
+    ])
+    for target, job_id in zip(failed, job_ids):
+        if job_id != target.job_id:
+            # A re-run keeps the run ID but fails in a new job, so the
+            # fetched log belongs to the previous attempt
+            target.error_lines = []
+            target.job_id = job_id
 
-        if env.status == Status.FAILURE and env.run_id:
-            env.error_lines = await fetch_error_logs(env.repo, env.run_id)
-            env.job_id = await fetch_failed_job_id(env.repo, env.run_id)
+    return env
 
-    # Fetch latest commit
-    env.last_commit = await fetch_latest_commit(env.repo, env.branch)
 
-    return env
+async def fetch_failure_logs(client: httpx.AsyncClient, app: App) -> bool:
+    """Fetch error logs for an app's failed runs that don't have them yet.
+
+    Returns True if any logs were fetched.
+    """
+    targets = [
+        target
+        for env in (app.dev, app.prod)
+        for target in _failed_runs(env)
+        if target.job_id and not target.error_lines
+    ]
+    if not targets:
+        return False
+
+    results = await asyncio.gather(*[
+        fetch_error_logs(client, target.repo, target.job_id)
+        for target in targets
+    ])
+    for target, lines in zip(targets, results):
+        target.error_lines = lines
+    return True
 
 
-async def fetch_health_check(env: Environment) -> None:
-    """Check if the environment URL is responding."""
+async def fetch_health_check(
+    client: httpx.AsyncClient,
+    env: Environment | Workflow,
+    revalidate: bool = False,
+) -> None:
+    """Check if the environment (or workflow) URL is responding.
+
+    A result from the last HEALTH_TTL seconds is reused, unless ``revalidate``
+    is set (the user asked for a refresh).
+    """
     if not env.url:
         return
 
-    url = f"https://{env.url}"
+    url = env.full_url
+    cached = _health_cache.get(url)
+    if cached and not revalidate and time.monotonic() - cached[0] < HEALTH_TTL:
+        env.health_ok, env.health_code, env.health_latency_ms, env.health_error = cached[1]
+        return
+
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            import time
-            start = time.monotonic()
-            response = await client.get(url)
-            latency = int((time.monotonic() - start) * 1000)
-
-            env.health_code = response.status_code
-            env.health_latency_ms = latency
-            env.health_ok = 200 <= response.status_code < 400
+        start = time.monotonic()
+        response = await client.get(url, timeout=10.0)
+        latency = int((time.monotonic() - start) * 1000)
+
+        env.health_code = response.status_code
+        env.health_latency_ms = latency
+        env.health_ok = 200 <= response.status_code < 400
+        env.health_error = None
     except httpx.TimeoutException:
         env.health_ok = False
         env.health_error = "Timeout"
@@ -395,82 +562,207 @@ async def fetch_health_check(env: Environment) -> None:
         env.health_ok = False
         env.health_error = str(e)[:50]
 
+    _health_cache[url] = (
+        time.monotonic(),
+        (env.health_ok, env.health_code, env.health_latency_ms, env.health_error),
+    )
 
-async def fetch_app_status(app: App) -> App:
-    """Fetch status for all environments of an app."""
-    # Fetch dev and prod in parallel
-    app.dev, app.prod = await asyncio.gather(
-        fetch_environment_status(app.dev),
-        fetch_environment_status(app.prod),
+
+async def fetch_app_health(client: httpx.AsyncClient, app: App, revalidate: bool = False) -> None:
+    """Run health checks for an app's environments and workflows."""
+    targets = [
+        # Environment health checks (only if no workflows)
+        *(env for env in (app.dev, app.prod) if env.url and not env.has_workflows),
+        # Workflow health checks
+        *(w for env in (app.dev, app.prod) for w in env.workflows if w.url),
+    ]
+    # A TaskGroup cancels the checks along with the caller (the app's
+    # refresh task, e.g. when a new refresh replaces it)
+    async with asyncio.TaskGroup() as tg:
+        for target in targets:
+            tg.create_task(fetch_health_check(client, target, revalidate))
+
+
+def _graphql_commit(node: Optional[dict], message_length: int) -> Optional[Commit]:
+    """Convert a GraphQL commit node into a Commit."""
+    if not node or not node.get("oid"):
+        return None
+
+    author = node.get("author") or {}
+    return Commit(
+        sha=node["oid"][:7],
+        message=node.get("messageHeadline", "")[:message_length],
+        author=author.get("name", ""),
+        date=_parse_time(author.get("date")),
     )
 
-    # Fetch branch comparisons if configured
-    repo = app.dev.repo or app.prod.repo
-    if repo and app.compare_configs:
-        comparisons = await asyncio.gather(*[
-            fetch_branch_comparison(repo, config)
-            for config in app.compare_configs
-        ])
-        app.comparisons = list(comparisons)
 
-    # Fetch latest release if tracking releases
-    if app.track_releases and repo:
-        app.latest_release = await fetch_latest_release(repo)
+async def fetch_git_info_graphql(client: httpx.AsyncClient, app: App, revalidate: bool = False) -> bool:
+    """Fetch an app's latest commits and branch comparisons in one GraphQL query.
+
+    Returns False if the query couldn't be made, so the caller can fall back
+    to the REST endpoints. Like cached_get, a response is reused for
+    COMMITS_TTL seconds without a request, unless ``revalidate`` is set.
+    GraphQL has no conditional requests, so revalidating re-runs the query.
+    """
+    token = get_token()
+    if not token:
+        # GraphQL always needs auth
+        return False
+
+    envs = [env for env in (app.dev, app.prod) if env.repo and env.branch]
+    configs = app.compare_configs if app.repo else []
+
+    # One aliased repository field per environment and per comparison,
+    # with every value passed as a variable
+    declarations = []
+    fields = []
+    variables = {}
+
+    def add_repository(alias: str, repo: str, ref: str, selection: str) -> None:
+        owner, _, name = repo.partition("/")
+        variables.update({f"{alias}_owner": owner, f"{alias}_name": name, f"{alias}_ref": ref})
+        declarations.extend(f"${alias}_{var}: String!" for var in ("owner", "name", "ref"))
+        fields.append(
+            f"{alias}: repository(owner: ${alias}_owner, name: ${alias}_name) "
+            f"{{ ref(qualifiedName: ${alias}_ref) {{ {selection} }} }}"
+        )
+
+    for i, env in enumerate(envs):
+        add_repository(f"env{i}", env.repo, env.branch, f"target {{ ... on Commit {{ {_GRAPHQL_COMMIT} }} }}")
+
+    for i, config in enumerate(configs):
+        variables[f"cmp{i}_head"] = config.head
+        declarations.append(f"$cmp{i}_head: String!")
+        add_repository(
+            f"cmp{i}", app.repo, config.base,
+            f"compare(headRef: $cmp{i}_head) {{ aheadBy behindBy "
+            f"commits(last: {COMPARE_COMMITS}) {{ nodes {{ {_GRAPHQL_COMMIT} }} }} }}",
+        )
+
+    if not fields:
+        return True
+
+    cached = _git_info_cache.get(app.name)
+    if cached and not revalidate and time.monotonic() - cached[0] < COMMITS_TTL:
+        data = cached[1]
+    else:
+        query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+        try:
+            response = await gh_request(
+                client, "POST", f"{API_URL}/graphql", _api_headers(),
+                json={"query": query, "variables": variables},
+            )
+            if response.status_code != 200:
+                return False
+            data = _loads(response.content).get("data")
+            if not data:
+                return False
+        except Exception:
+            return False
+        _git_info_cache[app.name] = (time.monotonic(), data)
+
+    for i, env in enumerate(envs):
+        ref = (data.get(f"env{i}") or {}).get("ref") or {}
+        env.last_commit = _graphql_commit(ref.get("target"), 60)
+
+    comparisons = []
+    for i, config in enumerate(configs):
+        comparison = BranchComparison(base=config.base, head=config.head)
+        ref = (data.get(f"cmp{i}") or {}).get("ref") or {}
+        compare = ref.get("compare") or {}
+        comparison.ahead_by = compare.get("aheadBy", 0)
+        comparison.behind_by = compare.get("behindBy", 0)
+        for node in (compare.get("commits") or {}).get("nodes", []):
+            commit = _graphql_commit(node, 50)
+            if commit:
+                comparison.commits.append(commit)
+        comparisons.append(comparison)
+    if configs:
+        app.comparisons = comparisons
+
+    return True
+
+
+async def fetch_git_info(client: httpx.AsyncClient, app: App, revalidate: bool = False) -> None:
+    """Fetch latest commits and branch comparisons for an app."""
+    if await fetch_git_info_graphql(client, app, revalidate):
+        return
+
+    # REST fallback: one request per environment and per comparison
+    envs = [env for env in (app.dev, app.prod) if env.repo]
+    configs = app.compare_configs if app.repo else []
+    results = await asyncio.gather(
+        *[fetch_latest_commit(client, env.repo, env.branch, revalidate) for env in envs],
+        *[fetch_branch_comparison(client, app.repo, config, revalidate) for config in configs],
+    )
+    for env, commit in zip(envs, results):
+        env.last_commit = commit
+    if configs:
+        app.comparisons = list(results[len(envs):])
+
+
+def _mark_unknown(env: Environment) -> None:
+    """Replace any statuses still loading after a failed fetch with NONE."""
+    for target in [env, *env.workflows]:
+        if target.status == Status.LOADING:
+            target.status = Status.NONE
+
+
+async def fetch_app_status(client: httpx.AsyncClient, app: App, revalidate: bool = False) -> App:
+    """Fetch status for all environments of an app.
+
+    With ``revalidate`` (a refresh the user asked for), cached responses
+    are checked against GitHub even if they're within their TTL.
+    """
+    # Commits, comparisons and release info don't depend on the build
+    # status, so fetch them in the same round as dev and prod
+    releases = [fetch_latest_release(client, app.repo, revalidate)] if app.track_releases and app.repo else []
+
+    # One failing request shouldn't lose the results of the others
+    dev, prod, _, *results = await asyncio.gather(
+        fetch_environment_status(client, app.dev, revalidate),
+        fetch_environment_status(client, app.prod, revalidate),
+        fetch_git_info(client, app, revalidate),
+        *releases,
+        return_exceptions=True,
+    )
+    for env, result in ((app.dev, dev), (app.prod, prod)):
+        if isinstance(result, Exception):
+            _mark_unknown(env)
+        env.update_overall_status()
+    app.update_overall_status()
+
+    if releases and not isinstance(results[0], Exception):
+        app.latest_release = results[0]
 
     app.loading = False
     return app
 
 
-async def fetch_latest_release(repo: str) -> Optional[Release]:
+async def fetch_latest_release(client: httpx.AsyncClient, repo: str, revalidate: bool = False) -> Optional[Release]:
     """Fetch the latest tag and its build status."""
     try:
-        # Get latest tag (sorted by version, descending)
-        cmd = [
-            "gh", "api", f"repos/{repo}/tags?per_page=1",
-            "--jq", '.[0] | {tag: .name, sha: .commit.sha}'
-        ]
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
-
-        if proc.returncode != 0:
-            return None
-
-        import json
-        data = json.loads(stdout.decode())
-
-        if not data or not data.get("tag"):
+        # Get latest tag
+        tags = await cached_get(client, f"repos/{repo}/tags", {"per_page": 1}, ttl=RELEASES_TTL, revalidate=revalidate)
+        if not tags or not tags[0].get("name"):
             return None
 
-        tag_name = data.get("tag", "")
+        tag_name = tags[0]["name"]
+        sha = tags[0].get("commit", {}).get("sha")
 
-        # Get commit info for the tag
-        commit_cmd = [
-            "gh", "api", f"repos/{repo}/commits/{data.get('sha')}",
-            "--jq", '{date: .commit.author.date, author: .commit.author.name}'
-        ]
-
-        commit_proc = await asyncio.create_subprocess_exec(
-            *commit_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        # The tag's commit info and its build runs only depend on the tag
+        commit_data, runs = await asyncio.gather(
+            cached_get(client, f"repos/{repo}/commits/{sha}", ttl=RELEASES_TTL),
+            cached_get(client, f"repos/{repo}/actions/runs", {"branch": tag_name, "per_page": 1}, revalidate=revalidate),
         )
-        commit_stdout, _ = await commit_proc.communicate()
 
         published = None
         author = ""
-        if commit_proc.returncode == 0:
-            commit_data = json.loads(commit_stdout.decode())
-            author = commit_data.get("author", "")
-            if commit_data.get("date"):
-                try:
-                    published = datetime.fromisoformat(commit_data["date"].replace("Z", "+00:00"))
-                except ValueError:
-                    pass
+        if commit_data:
+            commit_author = commit_data.get("commit", {}).get("author") or {}
+            author = commit_author.get("name", "")
+            published = _parse_time(commit_author.get("date"))
 
         release = Release(
             tag=tag_name,
@@ -479,34 +771,11 @@ async def fetch_latest_release(repo: str) -> Optional[Release]:
             published=published,
         )
 
-        # Get build status for this tag
-        # Look for workflow runs on the tag
-        run_cmd = [
-            "gh", "api", f"repos/{repo}/actions/runs?branch={release.tag}&per_page=1",
-            "--jq", '.workflow_runs[0] | {id, status, conclusion}'
-        ]
-
-        run_proc = await asyncio.create_subprocess_exec(
-            *run_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        run_stdout, _ = await run_proc.communicate()
-
-        if run_proc.returncode == 0:
-            run_output = run_stdout.decode().strip()
-            if run_output and run_output != "null":
-                run_data = json.loads(run_output)
-                status_str = run_data.get("status", "")
-                conclusion = run_data.get("conclusion", "")
-                release.build_run_id = run_data.get("id")
-
-                if status_str == "completed":
-                    release.build_status = Status.SUCCESS if conclusion == "success" else Status.FAILURE
-                elif status_str in ("in_progress", "queued", "waiting"):
-                    release.build_status = Status.RUNNING
-                else:
-                    release.build_status = Status.NONE
+        # Build status from the latest workflow run on the tag
+        if runs and runs.get("workflow_runs"):
+            result = _parse_run(runs["workflow_runs"][0])
+            release.build_run_id = result["run_id"]
+            release.build_status = result["status"]
 
         return release
 
@@ -516,7 +785,6 @@ async def fetch_latest_release(repo: str) -> Optional[Release]:
 
 def open_in_browser(url: str) -> None:
     """Open a URL in the default browser."""
-    import webbrowser
     webbrowser.open(url)
 
 
@@ -2,19 +2,51 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 
 
-class Status(Enum):
-    NONE = "none"
-    SUCCESS = "success"
-    FAILURE = "failure"
-    RUNNING = "running"
-    LOADING = "loading"
+class Status(IntEnum):
+    NONE = 0
+    SUCCESS = 1
+    FAILURE = 2
+    RUNNING = 3
+    LOADING = 4
 
 
-@dataclass
+# CSS class suffix for each status (e.g. "status-success")
+STATUS_CSS_NAMES = {
+    Status.NONE: "none",
+    Status.SUCCESS: "success",
+    Status.FAILURE: "failure",
+    Status.RUNNING: "running",
+    Status.LOADING: "loading",
+}
+
+# CSS class for a status icon or label (e.g. "status-success")
+STATUS_CLASSES = {status: f"status-{name}" for status, name in STATUS_CSS_NAMES.items()}
+
+
+# Icons for an app's overall status
+APP_STATUS_ICONS = {
+    Status.SUCCESS: "✅",
+    Status.FAILURE: "❌",
+    Status.RUNNING: "🔄",
+    Status.LOADING: "⏳",
+    Status.NONE: "⚪",
+}
+
+# Compact icons for environment and workflow statuses
+STATUS_ICONS = {
+    Status.SUCCESS: "✓",
+    Status.FAILURE: "✗",
+    Status.RUNNING: "◐",
+    Status.LOADING: "⋯",
+    Status.NONE: "○",
+}
+
+
+@dataclass(slots=True)
 class Workflow:
     """A GitHub Actions workflow (for apps with multiple workflows like login)."""
     name: str  # GitHub workflow name (for API)
@@ -35,13 +67,15 @@ class Workflow:
     health_code: Optional[int] = None
     health_latency_ms: Optional[int] = None
     health_error: Optional[str] = None
+    full_url: str = field(default="", init=False)  # url with its scheme, "" if not deployed
 
     def __post_init__(self):
         if not self.display_name:
             self.display_name = self.name
+        self.full_url = f"https://{self.url}" if self.url else ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Commit:
     """A git commit."""
     sha: str
@@ -50,7 +84,7 @@ class Commit:
     date: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BranchComparison:
     """Comparison between two branches."""
     base: str
@@ -60,7 +94,7 @@ class BranchComparison:
     commits: list[Commit] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Environment:
     """A deployment environment (dev/prod)."""
     name: str
@@ -81,30 +115,41 @@ class Environment:
     health_code: Optional[int] = None
     health_latency_ms: Optional[int] = None
     health_error: Optional[str] = None
+    overall_status: Status = field(default=Status.LOADING, init=False)  # Set by update_overall_status()
+    latest_time: Optional[datetime] = field(default=None, init=False)  # Most recent workflow run time
+    full_url: str = field(default="", init=False)  # url with its scheme, "" if not deployed
+    repo_url: str = field(default="", init=False)  # GitHub page for repo, "" if none
+
+    def __post_init__(self):
+        # url and repo come from the app config and never change
+        self.full_url = f"https://{self.url}" if self.url else ""
+        self.repo_url = f"https://github.com/{self.repo}" if self.repo else ""
+        self.update_overall_status()
 
     @property
     def has_workflows(self) -> bool:
         return len(self.workflows) > 0
 
-    @property
-    def overall_status(self) -> Status:
-        """Get overall status considering workflows."""
+    def update_overall_status(self) -> None:
+        """Recompute the overall status from the environment's (or its workflows') status."""
         if not self.has_workflows:
-            return self.status
+            self.overall_status = self.status
+            return
 
         statuses = [w.status for w in self.workflows]
         if Status.FAILURE in statuses:
-            return Status.FAILURE
-        if Status.RUNNING in statuses:
-            return Status.RUNNING
-        if Status.LOADING in statuses:
-            return Status.LOADING
-        if all(s == Status.SUCCESS for s in statuses):
-            return Status.SUCCESS
-        return Status.NONE
+            self.overall_status = Status.FAILURE
+        elif Status.RUNNING in statuses:
+            self.overall_status = Status.RUNNING
+        elif Status.LOADING in statuses:
+            self.overall_status = Status.LOADING
+        elif all(s == Status.SUCCESS for s in statuses):
+            self.overall_status = Status.SUCCESS
+        else:
+            self.overall_status = Status.NONE
 
 
-@dataclass
+@dataclass(slots=True)
 class BranchCompareConfig:
     """Configuration for branch comparison."""
     base: str
@@ -112,7 +157,7 @@ class BranchCompareConfig:
     label: str  # Display label like "develop → main"
 
 
-@dataclass
+@dataclass(slots=True)
 class Release:
     """A GitHub release."""
     tag: str
@@ -123,7 +168,7 @@ class Release:
     build_run_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class App:
     """An application in the dashboard."""
     name: str
@@ -135,45 +180,42 @@ class App:
     comparisons: list[BranchComparison] = field(default_factory=list)
     latest_release: Optional[Release] = None
     track_releases: bool = False  # Whether to fetch release info
+    repo: str = field(default="", init=False)  # Repo for comparisons/releases
+    card_id: str = field(default="", init=False)  # Widget ID of the app's card
+    overall_status: Status = field(default=Status.LOADING, init=False)  # Set by update_overall_status()
 
-    @property
-    def overall_status(self) -> Status:
-        """Get overall status of the app."""
-        dev_status = self.dev.overall_status
-        prod_status = self.prod.overall_status
-
-        if dev_status == Status.FAILURE or prod_status == Status.FAILURE:
-            return Status.FAILURE
-        if dev_status == Status.RUNNING or prod_status == Status.RUNNING:
-            return Status.RUNNING
-        if dev_status == Status.LOADING or prod_status == Status.LOADING:
-            return Status.LOADING
-        if dev_status == Status.SUCCESS or prod_status == Status.SUCCESS:
-            return Status.SUCCESS
-        return Status.NONE
+    def __post_init__(self):
+        self.repo = self.dev.repo or self.prod.repo
+        self.card_id = f"card-{self.name.lower().replace(' ', '-')}"
+        self.update_overall_status()
+
+    def update_overall_status(self) -> None:
+        """Recompute the overall status from dev and prod.
+
+        Call after updating the environments' overall status.
+        """
+        statuses = (self.dev.overall_status, self.prod.overall_status)
+
+        if Status.FAILURE in statuses:
+            self.overall_status = Status.FAILURE
+        elif Status.RUNNING in statuses:
+            self.overall_status = Status.RUNNING
+        elif Status.LOADING in statuses:
+            self.overall_status = Status.LOADING
+        elif Status.SUCCESS in statuses:
+            self.overall_status = Status.SUCCESS
+        else:
+            self.overall_status = Status.NONE
 
     @property
     def status_icon(self) -> str:
         """Get status icon for the app."""
-        status = self.overall_status
-        return {
-            Status.SUCCESS: "✅",
-            Status.FAILURE: "❌",
-            Status.RUNNING: "🔄",
-            Status.LOADING: "⏳",
-            Status.NONE: "⚪",
-        }.get(status, "⚪")
+        return APP_STATUS_ICONS[self.overall_status]
 
 
 def get_status_icon(status: Status) -> str:
     """Get icon for a status."""
-    return {
-        Status.SUCCESS: "✓",
-        Status.FAILURE: "✗",
-        Status.RUNNING: "◐",
-        Status.LOADING: "⋯",
-        Status.NONE: "○",
-    }.get(status, "○")
+    return STATUS_ICONS[status]
 
 
 def get_apps() -> list[App]:
@@ -1,6 +1,7 @@
 """App card widget for the deploy status dashboard."""
 
 from datetime import datetime, timezone
+from typing import Optional
 
 import humanize
 from textual.app import ComposeResult
@@ -9,7 +10,17 @@ from textual.widgets import Static, LoadingIndicator
 from textual.reactive import reactive
 from textual.message import Message
 
-from ..models import App, Environment, Status, get_status_icon
+from ..models import STATUS_CLASSES, App, Environment, Status, get_status_icon
+
+# (upper limit in seconds, unit in seconds, suffix) for short times;
+# anything under a minute is just "now"
+_TIME_BUCKETS = (
+    (60, None, "now"),
+    (3600, 60, "m"),
+    (86400, 3600, "h"),
+    (604800, 86400, "d"),
+    (None, 604800, "w"),
+)
 
 
 class AppCard(Static):
@@ -47,6 +58,10 @@ class AppCard(Static):
         border: solid $warning;
     }
 
+    AppCard.refreshing {
+        opacity: 0.6;
+    }
+
     AppCard .app-header {
         height: 1;
         width: 100%;
@@ -130,37 +145,24 @@ class AppCard(Static):
     def __init__(self, app: App, **kwargs) -> None:
         super().__init__(**kwargs)
         self.app_data = app
+        self._last_render: Optional[tuple] = None  # What update_app last showed
 
-    def _get_env_time(self, env: Environment) -> str:
+    def _get_env_time(self, env: Environment, now: datetime) -> str:
         """Get short time string for environment."""
-        # For environments with workflows, get the most recent time
-        if env.has_workflows:
-            times = [w.time for w in env.workflows if w.time]
-            if times:
-                latest = max(times)
-                return self._format_short_time(latest)
-        elif env.time:
-            return self._format_short_time(env.time)
-        return ""
+        # For environments with workflows, use the most recent run's time
+        latest = env.latest_time or env.time
+        return self._format_short_time(latest, now) if latest else ""
 
-    def _format_short_time(self, dt: datetime) -> str:
+    def _format_short_time(self, dt: datetime, now: datetime) -> str:
         """Format time as short string like '2h', '3d', '1w'."""
-        now = datetime.now(timezone.utc)
         # Ensure dt has timezone info
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
-        delta = now - dt
-        seconds = delta.total_seconds()
-        if seconds < 60:
-            return "now"
-        elif seconds < 3600:
-            return f"{int(seconds // 60)}m"
-        elif seconds < 86400:
-            return f"{int(seconds // 3600)}h"
-        elif seconds < 604800:
-            return f"{int(seconds // 86400)}d"
-        else:
-            return f"{int(seconds // 604800)}w"
+        seconds = (now - dt).total_seconds()
+        for limit, unit, suffix in _TIME_BUCKETS:
+            if limit is None or seconds < limit:
+                return f"{int(seconds // unit)}{suffix}" if unit else suffix
+        return ""
 
     def compose(self) -> ComposeResult:
         """Compose the card layout."""
@@ -174,77 +176,103 @@ class AppCard(Static):
         loading_class = "" if is_loading else "hidden"
         status_class = "hidden" if is_loading else ""
 
-        yield LoadingIndicator(id="card-loader", classes=loading_class)
+        # Keep references to the widgets update_app changes, so updates
+        # don't need to query the DOM
+        self._loader = LoadingIndicator(id="card-loader", classes=loading_class)
+        yield self._loader
 
         # Status rows with time (hidden when loading)
         dev_icon = get_status_icon(self.app_data.dev.overall_status)
-        dev_status_class = f"status-{self.app_data.dev.overall_status.value}"
-        dev_time = self._get_env_time(self.app_data.dev)
+        self._dev_cls = STATUS_CLASSES[self.app_data.dev.overall_status]
+        now = datetime.now(timezone.utc)
+        dev_time = self._get_env_time(self.app_data.dev, now)
 
         prod_icon = get_status_icon(self.app_data.prod.overall_status)
-        prod_status_class = f"status-{self.app_data.prod.overall_status.value}"
-        prod_time = self._get_env_time(self.app_data.prod)
-
-        with Horizontal(id="dev-row", classes=f"status-row {status_class}"):
+        self._prod_cls = STATUS_CLASSES[self.app_data.prod.overall_status]
+        prod_time = self._get_env_time(self.app_data.prod, now)
+        self._last_render = (
+            self.app_data.dev.overall_status,
+            self.app_data.prod.overall_status,
+            dev_time,
+            prod_time,
+            is_loading,
+        )
+
+        self._dev_status = Static(dev_icon, id="dev-status", classes=f"env-status {self._dev_cls}")
+        self._dev_time = Static(dev_time, id="dev-time", classes="env-time")
+        with Horizontal(id="dev-row", classes=f"status-row {status_class}") as self._dev_row:
             yield Static("DEV", classes="env-label")
-            yield Static(dev_icon, id="dev-status", classes=f"env-status {dev_status_class}")
-            yield Static(dev_time, id="dev-time", classes="env-time")
+            yield self._dev_status
+            yield self._dev_time
 
-        with Horizontal(id="prod-row", classes=f"status-row {status_class}"):
+        self._prod_status = Static(prod_icon, id="prod-status", classes=f"env-status {self._prod_cls}")
+        self._prod_time = Static(prod_time, id="prod-time", classes="env-time")
+        with Horizontal(id="prod-row", classes=f"status-row {status_class}") as self._prod_row:
             yield Static("PROD", classes="env-label")
-            yield Static(prod_icon, id="prod-status", classes=f"env-status {prod_status_class}")
-            yield Static(prod_time, id="prod-time", classes="env-time")
+            yield self._prod_status
+            yield self._prod_time
+
+    def update_app(self, app: App, now: Optional[datetime] = None) -> None:
+        """Update the card with new app data.
 
-    def update_app(self, app: App) -> None:
-        """Update the card with new app data."""
+        ``now`` is the reference time for the relative times, so a refresh
+        can share one timestamp across all cards.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
         self.app_data = app
+        self.remove_class("refreshing")
+
+        dev_status = self.app_data.dev.overall_status
+        prod_status = self.app_data.prod.overall_status
+        dev_time = self._get_env_time(self.app_data.dev, now)
+        prod_time = self._get_env_time(self.app_data.prod, now)
+
+        # Most refreshes change nothing, so skip touching the widgets
+        render = (dev_status, prod_status, dev_time, prod_time, self.app_data.loading)
+        if render == self._last_render:
+            return
+
         self._update_status_class()
 
         # Update individual elements instead of full recompose
         try:
             # Toggle loading indicator visibility
-            loader = self.query_one("#card-loader", LoadingIndicator)
-            dev_row = self.query_one("#dev-row")
-            prod_row = self.query_one("#prod-row")
-
             if self.app_data.loading:
-                loader.remove_class("hidden")
-                dev_row.add_class("hidden")
-                prod_row.add_class("hidden")
+                self._loader.remove_class("hidden")
+                self._dev_row.add_class("hidden")
+                self._prod_row.add_class("hidden")
             else:
-                loader.add_class("hidden")
-                dev_row.remove_class("hidden")
-                prod_row.remove_class("hidden")
-
-            dev_icon = get_status_icon(self.app_data.dev.overall_status)
-            prod_icon = get_status_icon(self.app_data.prod.overall_status)
-            dev_time = self._get_env_time(self.app_data.dev)
-            prod_time = self._get_env_time(self.app_data.prod)
-
-            dev_status = self.query_one("#dev-status", Static)
-            prod_status = self.query_one("#prod-status", Static)
+                self._loader.add_class("hidden")
+                self._dev_row.remove_class("hidden")
+                self._prod_row.remove_class("hidden")
 
             # Update status icons
-            dev_status.update(dev_icon)
-            prod_status.update(prod_icon)
-
-            # Update status classes
-            for cls in list(dev_status.classes):
-                if cls.startswith("status-"):
-                    dev_status.remove_class(cls)
-            dev_status.add_class(f"status-{self.app_data.dev.overall_status.value}")
-
-            for cls in list(prod_status.classes):
-                if cls.startswith("status-"):
-                    prod_status.remove_class(cls)
-            prod_status.add_class(f"status-{self.app_data.prod.overall_status.value}")
+            self._dev_status.update(get_status_icon(dev_status))
+            self._prod_status.update(get_status_icon(prod_status))
+
+            # Update status classes, swapping only the one that's set
+            dev_cls = STATUS_CLASSES[dev_status]
+            if dev_cls != self._dev_cls:
+                self._dev_status.remove_class(self._dev_cls)
+                self._dev_status.add_class(dev_cls)
+                self._dev_cls = dev_cls
+
+            prod_cls = STATUS_CLASSES[prod_status]
+            if prod_cls != self._prod_cls:
+                self._prod_status.remove_class(self._prod_cls)
+                self._prod_status.add_class(prod_cls)
+                self._prod_cls = prod_cls
 
             # Update times
-            self.query_one("#dev-time", Static).update(dev_time)
-            self.query_one("#prod-time", Static).update(prod_time)
-        except Exception:
-            # Fallback to recompose if elements not found
+            self._dev_time.update(dev_time)
+            self._prod_time.update(prod_time)
+        except AttributeError:
+            # Not composed yet; compose will use the new data
             self.refresh(recompose=True)
+            return
+
+        self._last_render = render
 
     def _update_status_class(self) -> None:
         """Update the card's status class based on app status."""
@@ -1,8 +1,12 @@
 """Detail view widget for showing app deployment details."""
 
 import asyncio
+import functools
 import platform
+import re
+import shutil
 import subprocess
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -10,36 +14,243 @@ from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal, VerticalScroll
 from textual.widgets import Static, Button, LoadingIndicator, TabbedContent, TabPane
 from textual.message import Message
+from textual.widget import Widget
 
 import humanize
+from rich.style import Style
+from rich.table import Table
+from rich.text import Text
 
-from ..models import App, BranchComparison, Commit, Environment, Release, Status, Workflow, get_status_icon
-from ..github import fetch_health_check
+from ..models import STATUS_CLASSES, STATUS_CSS_NAMES, STATUS_ICONS, App, BranchComparison, Commit, Environment, Release, Status, Workflow
+
+
+# Status text shown in the detail view, e.g. "✓ SUCCESS"
+_STATUS_LABELS = {status: f"{icon} {status.name}" for status, icon in STATUS_ICONS.items()}
+
+# Full class strings for widgets styled by status
+_INFO_VALUE_CLASSES = {status: f"info-value {cls}" for status, cls in STATUS_CLASSES.items()}
+_ENV_SECTION_CLASSES = {status: f"env-section {name}" for status, name in STATUS_CSS_NAMES.items()}
+_WORKFLOW_CARD_CLASSES = {status: f"workflow-card {name}" for status, name in STATUS_CSS_NAMES.items()}
+
+# The status classes a health widget can have
+_HEALTH_CLASSES = tuple(STATUS_CLASSES[status] for status in (Status.LOADING, Status.SUCCESS, Status.FAILURE))
+
+# Width of the longest row label ("Triggered by:"). Labels take this many
+# columns plus a space; .info-label in rows with buttons matches it.
+LABEL_WIDTH = 13
+
+# Characters that can't be used in widget IDs
+_INVALID_ID_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+# Relative times are computed against the current time rounded down to
+# this many seconds, so re-renders reuse the cached strings
+NOW_GRANULARITY = 5
+
+
+def _now_bucket() -> int:
+    """Get the current Unix time rounded down to NOW_GRANULARITY."""
+    now = int(time.time())
+    return now - now % NOW_GRANULARITY
+
+
+@functools.lru_cache(maxsize=1024)
+def _natural_time(value: datetime, now: int) -> str:
+    """Format a time like '3 hours ago' relative to a _now_bucket() value."""
+    return humanize.naturaltime(value, when=datetime.fromtimestamp(now, timezone.utc))
+
+
+@functools.lru_cache(maxsize=256)
+def _natural_delta(seconds: int) -> str:
+    """Format a duration like '4 minutes'."""
+    return humanize.naturaldelta(seconds)
+
+
+def _workflow_key(env_name: str, workflow: Workflow) -> str:
+    """Key (and widget ID suffix) for a workflow card."""
+    return _INVALID_ID_CHARS.sub("-", f"{env_name}-{workflow.display_name}")
+
+
+def _run_shape(target: Environment | Workflow) -> tuple:
+    """The parts of an environment's or workflow's run that decide which rows are shown."""
+    failed = target.status == Status.FAILURE and bool(target.error_lines)
+    return (
+        target.time is not None,
+        bool(target.actor),
+        bool(target.duration_seconds),
+        (target.run_id, target.job_id) if failed else None,
+    )
+
+
+def _fingerprint(app: App) -> tuple:
+    """Summarize the widget structure the detail view composes for an app.
+
+    The models are updated in place, so this is compared against the last
+    compose to tell whether the widgets can be patched (see _field_values)
+    instead of recomposed. Commits, comparisons and releases are replaced
+    (not mutated) on each fetch, so they can be compared as they are.
+    """
+    release = app.latest_release
+    return (
+        app.name,
+        app.loading,
+        (release.tag, release.author, release.published is not None) if release else None,
+        tuple(app.comparisons),
+        *(
+            (
+                _run_shape(env),
+                tuple(_run_shape(workflow) for workflow in env.workflows),
+                env.last_commit,
+            )
+            for env in (app.dev, app.prod)
+        ),
+    )
+
+
+def _run_values(values: dict, key: str, target: Environment | Workflow, now: int) -> None:
+    """Add the changing text of an environment's or workflow's run to values."""
+    values[f"status-{key}"] = (_STATUS_LABELS[target.status], _INFO_VALUE_CLASSES[target.status])
+    values[f"time-{key}"] = (_natural_time(target.time, now) if target.time else "", "info-value")
+    values[f"actor-{key}"] = (f"@{target.actor}", "info-value actor")
+
+
+def _field_values(app: App, now: int) -> dict[str, tuple[Optional[str], str]]:
+    """Get the (text, classes) of every widget that can change without a recompose.
+
+    A text of None means only the widget's classes are set.
+    """
+    values = {}
+
+    release = app.latest_release
+    if release:
+        values["release-status"] = (_STATUS_LABELS[release.build_status], _INFO_VALUE_CLASSES[release.build_status])
+        if release.published:
+            values["release-published"] = (f"{_natural_time(release.published, now)} by @{release.author}", "info-value")
+
+    for env in (app.dev, app.prod):
+        values[f"section-{env.name}"] = (None, _ENV_SECTION_CLASSES[env.overall_status])
+        _run_values(values, env.name, env, now)
+        values[f"duration-{env.name}"] = (_natural_delta(env.duration_seconds) if env.duration_seconds else "", "info-value")
+
+        for workflow in env.workflows:
+            key = _workflow_key(env.name, workflow)
+            values[f"card-{key}"] = (None, _WORKFLOW_CARD_CLASSES[workflow.status])
+            _run_values(values, key, workflow, now)
+
+        commit = env.last_commit
+        if commit:
+            values[f"commit-time-{env.name}"] = (_natural_time(commit.date, now) if commit.date else "", "env-commit-row")
+
+    return values
+
+
+def _find_clipboard_command() -> Optional[list[str]]:
+    """Find the command that copies its stdin to the clipboard, if any."""
+    if platform.system() == "Darwin":
+        return ["pbcopy"]
+    # Linux - try multiple clipboard tools
+    for cmd in [
+        ["wl-copy"],  # Wayland
+        ["xclip", "-selection", "clipboard"],  # X11
+        ["xsel", "--clipboard", "--input"],  # X11 alternative
+    ]:
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+
+# Looked up once, so copying doesn't retry missing tools every time
+_CLIPBOARD_COMMAND = _find_clipboard_command()
 
 
 def copy_to_clipboard(text: str) -> bool:
     """Copy text to clipboard. Returns True if successful."""
+    if _CLIPBOARD_COMMAND is None:
+        return False
     try:
-        if platform.system() == "Darwin":
-            subprocess.run(["pbcopy"], input=text.encode(), check=True)
-            return True
-        else:
-            # Linux - try multiple clipboard tools
-            for cmd in [
-                ["wl-copy"],  # Wayland
-                ["xclip", "-selection", "clipboard"],  # X11
-                ["xsel", "--clipboard", "--input"],  # X11 alternative
-            ]:
-                try:
-                    subprocess.run(cmd, input=text.encode(), check=True, stderr=subprocess.DEVNULL)
-                    return True
-                except FileNotFoundError:
-                    continue
-            return False
+        subprocess.run(_CLIPBOARD_COMMAND, input=text.encode(), check=True, stderr=subprocess.DEVNULL)
+        return True
     except Exception:
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def _label_text(label: str, style: Style) -> Text:
+    """Get the padded, styled text for an InfoRow label (shared, don't modify)."""
+    # Padded, not cut, so the value always starts after a space
+    return Text(f"{label:<{LABEL_WIDTH}} ", style=style)
+
+
+class InfoRow(Static):
+    """A label and its value on one line, as a single widget.
+
+    The widget's classes style the value; the label is always muted, like
+    the .info-label used in rows with buttons.
+    """
+
+    COMPONENT_CLASSES = {"info-row--label"}
+
+    DEFAULT_CSS = """
+    InfoRow {
+        height: 1;
+        width: 100%;
+    }
+
+    InfoRow > .info-row--label {
+        color: $text-muted;
+    }
+    """
+
+    def __init__(self, label: str, value: str = "", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._label = label
+        self._value = value
+
+    def render(self) -> Text:
+        label_style = self.get_component_rich_style("info-row--label")
+        return Text.assemble(_label_text(self._label, label_style), self._value)
+
+    def update(self, value: str = "", *, layout: bool = True) -> None:
+        """Update the value, keeping the label."""
+        self._value = value
+        self.refresh(layout=layout)
+
+
+class CommitRow(Static):
+    """An environment's last commit on one line: label, SHA, message and time.
+
+    The value passed to update is the time, the only part that changes.
+    """
+
+    def __init__(self, label: str, commit: Commit, time_text: str = "", **kwargs) -> None:
+        self._label = label
+        self._commit = commit
+        super().__init__(self._row(time_text), **kwargs)
+
+    def _row(self, time_text: str) -> Table:
+        grid = Table.grid(expand=True)
+        grid.add_column(width=6, style="dim")
+        grid.add_column(width=8, style="yellow")
+        grid.add_column(ratio=1, no_wrap=True)
+        grid.add_column(width=15, justify="right", style="dim")
+        grid.add_row(self._label, self._commit.sha, self._commit.message[:30], time_text)
+        return grid
+
+    def update(self, time_text: str = "", *, layout: bool = True) -> None:
+        """Update the time, keeping the rest of the row."""
+        super().update(self._row(time_text), layout=layout)
+
+
+class GitInfo(VerticalScroll):
+    """The Git tab's contents, composed by the detail view when the tab is opened."""
+
+    def __init__(self, view: "DetailView", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._view = view
+
+    def compose(self) -> ComposeResult:
+        yield from self._view.compose_git_info()
+
+
 class DetailView(Static):
     """A detailed view of an app's deployment status."""
 
@@ -147,7 +358,7 @@ class DetailView(Static):
     }
 
     DetailView .info-label {
-        width: 8;
+        width: 14;
         color: $text-muted;
     }
 
@@ -219,23 +430,6 @@ class DetailView(Static):
         color: $text;
     }
 
-    DetailView .commit-section {
-        margin-top: 1;
-        padding: 0 1;
-        background: $surface-lighten-1;
-        border: solid $surface-lighten-2;
-    }
-
-    DetailView .commit-title {
-        text-style: bold;
-        color: $primary;
-    }
-
-    DetailView .commit-sha {
-        color: $warning;
-        text-style: bold;
-    }
-
     DetailView .actor {
         color: $primary;
     }
@@ -276,10 +470,6 @@ class DetailView(Static):
         text-style: underline;
     }
 
-    DetailView .hidden {
-        display: none;
-    }
-
     DetailView .no-data {
         color: $text-muted;
         text-style: italic;
@@ -317,39 +507,11 @@ class DetailView(Static):
         height: 1;
     }
 
-    DetailView .env-commit-label {
-        width: 6;
-        color: $text-muted;
-    }
-
-    DetailView .commit-msg-short {
-        width: 1fr;
-    }
-
-    DetailView .commit-time {
-        width: 15;
-        color: $text-muted;
-        text-align: right;
-    }
-
     DetailView .section-title {
         text-style: bold;
         margin-top: 1;
     }
 
-    DetailView .commit-row {
-        height: 1;
-    }
-
-    DetailView .commit-sha-small {
-        width: 8;
-        color: $warning;
-    }
-
-    DetailView .commit-msg {
-        width: 1fr;
-    }
-
     DetailView .commit-author {
         width: 12;
         color: $text-muted;
@@ -388,49 +550,26 @@ class DetailView(Static):
     def __init__(self, app: App, **kwargs) -> None:
         super().__init__(**kwargs)
         self.app_data = app
-        self._health_task: Optional[asyncio.Task] = None
-
-    async def on_mount(self) -> None:
-        """Start health checks when mounted."""
-        self._health_task = asyncio.create_task(self._run_health_checks())
-
-    async def _run_health_checks(self) -> None:
-        """Run health checks for environments and workflows."""
-        tasks = []
-        # Environment health checks (only if no workflows)
-        if self.app_data.dev.url and not self.app_data.dev.has_workflows:
-            tasks.append(fetch_health_check(self.app_data.dev))
-        if self.app_data.prod.url and not self.app_data.prod.has_workflows:
-            tasks.append(fetch_health_check(self.app_data.prod))
-
-        # Workflow health checks
-        for env in [self.app_data.dev, self.app_data.prod]:
-            for workflow in env.workflows:
-                if workflow.url:
-                    tasks.append(self._fetch_workflow_health(workflow))
-
-        if tasks:
-            await asyncio.gather(*tasks)
-            self._update_health_display()
-
-    async def _fetch_workflow_health(self, workflow) -> None:
-        """Fetch health check for a workflow."""
-        import httpx
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                url = f"https://{workflow.url}"
-                start = asyncio.get_event_loop().time()
-                response = await client.get(url, follow_redirects=True)
-                latency = int((asyncio.get_event_loop().time() - start) * 1000)
-                workflow.health_ok = response.status_code < 400
-                workflow.health_code = response.status_code
-                workflow.health_latency_ms = latency
-        except Exception as e:
-            workflow.health_ok = False
-            workflow.health_error = str(e)[:30]
+        self._last_fp = _fingerprint(app)
+        # Widgets that update_app can patch in place, and their current values
+        self._fields: dict[str, Widget] = {}
+        self._values: dict[str, tuple[Optional[str], str]] = {}
+        self._git_built = False
+        # Copy button ID -> (text to copy, message shown when copied)
+        self._copy_targets: dict[str, tuple[str, str]] = {}
+        # Health row ID -> the (text, status) it shows
+        self._health_shown: dict[str, tuple[str, Status]] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the detail view."""
+        # Text that can change between refreshes is computed up front (with
+        # one reference time) so update_app can patch it later
+        self._fields = {}
+        self._values = _field_values(self.app_data, _now_bucket())
+        self._git_built = False
+        self._copy_targets = {}
+        self._health_shown = {}
+
         with Vertical(classes="detail-content"):
             # Header
             with Horizontal(classes="detail-header"):
@@ -438,16 +577,17 @@ class DetailView(Static):
                 yield Static(self.app_data.name, classes="detail-title")
                 yield Button("Close [Esc]", id="close-btn", classes="close-btn", variant="default")
 
-            # Loading indicator
-            loading_class = "" if self.app_data.loading else "hidden"
-            content_class = "hidden" if self.app_data.loading else ""
-
-            with Vertical(id="detail-loading", classes=loading_class):
-                yield Static("Fetching status...", classes="loading-text")
-                yield LoadingIndicator()
+            # While loading there's nothing to show yet, so skip building
+            # the tabs; loading is part of the fingerprint, so update_app
+            # recomposes once the data arrives
+            if self.app_data.loading:
+                with Vertical(id="detail-loading"):
+                    yield Static("Fetching status...", classes="loading-text")
+                    yield LoadingIndicator()
+                return
 
             # Content with tabs
-            with TabbedContent(id="detail-tabs", classes=content_class):
+            with TabbedContent(id="detail-tabs"):
                 with TabPane("Build Status", id="tab-builds"):
                     with Vertical(id="builds-container"):
                         # Release info if tracking
@@ -460,113 +600,106 @@ class DetailView(Static):
                             yield from self._render_environment_section(self.app_data.prod, "Production")
                         yield Static("Press 'o' GitHub, 'u' URL, 'Esc' close", classes="action-hint")
 
-                with TabPane("Git", id="tab-branches"):
-                    with VerticalScroll():
-                        # Last commits per environment
-                        yield Static("Último commit por ambiente:", classes="section-title")
-                        if self.app_data.dev.last_commit:
-                            yield from self._render_env_commit(self.app_data.dev)
-                        if self.app_data.prod.last_commit:
-                            yield from self._render_env_commit(self.app_data.prod)
-
-                        # Branch comparisons
-                        if self.app_data.comparisons:
-                            yield Static("Comparación de branches:", classes="section-title")
-                            yield from self._render_comparisons()
-                        elif not self.app_data.dev.last_commit and not self.app_data.prod.last_commit:
-                            yield Static("No git info available", classes="no-data")
+                # Filled in when the tab is first opened (on_tabbed_content_tab_activated)
+                yield TabPane("Git", id="tab-branches")
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Compose the Git tab the first time it's shown."""
+        if event.pane.id == "tab-branches" and not self._git_built:
+            self._git_built = True
+            event.pane.mount(GitInfo(self))
+
+    def compose_git_info(self) -> ComposeResult:
+        """Compose the contents of the Git tab."""
+        # Last commits per environment
+        yield Static("Último commit por ambiente:", classes="section-title")
+        if self.app_data.dev.last_commit:
+            yield from self._render_env_commit(self.app_data.dev)
+        if self.app_data.prod.last_commit:
+            yield from self._render_env_commit(self.app_data.prod)
+
+        # Branch comparisons
+        if self.app_data.comparisons:
+            yield Static("Comparación de branches:", classes="section-title")
+            yield from self._render_comparisons()
+        elif not self.app_data.dev.last_commit and not self.app_data.prod.last_commit:
+            yield Static("No git info available", classes="no-data")
 
     def _render_release_section(self, release: Release) -> ComposeResult:
         """Render the latest release section."""
-        status_icon = get_status_icon(release.build_status)
-        status_class = f"status-{release.build_status.value}"
-
         with Vertical(classes="release-section"):
             yield Static("📦 Latest Release", classes="section-title")
 
-            with Horizontal(classes="info-row"):
-                yield Static("Version:", classes="info-label")
-                yield Static(release.tag, classes="info-value release-tag")
+            yield InfoRow("Version:", release.tag, classes="info-value release-tag")
 
-            with Horizontal(classes="info-row"):
-                yield Static("Build:", classes="info-label")
-                yield Static(f"{status_icon} {release.build_status.value.upper()}", classes=f"info-value {status_class}")
+            yield self._field("release-status", "Build:")
 
             if release.published:
-                time_ago = humanize.naturaltime(release.published, when=datetime.now(timezone.utc))
-                with Horizontal(classes="info-row"):
-                    yield Static("Published:", classes="info-label")
-                    yield Static(f"{time_ago} by @{release.author}", classes="info-value")
+                yield self._field("release-published", "Published:")
 
     def _render_environment_section(self, env: Environment, title: str) -> ComposeResult:
         """Render an environment section."""
-        status_class = env.overall_status.value
-
-        with Vertical(classes=f"env-section {status_class}"):
-            yield Static(f"{title} ({env.name})", classes="section-title")
+        env_name = env.name
+        section_key = f"section-{env_name}"
+        with Vertical(classes=self._values[section_key][1]) as section:
+            self._fields[section_key] = section
+            yield Static(f"{title} ({env_name})", classes="section-title")
 
             # If we have workflows, show them as cards (vertical stack)
             if env.has_workflows:
                 with Vertical(classes="workflow-list"):
                     for workflow in env.workflows:
-                        yield from self._render_workflow_card(workflow, env.name)
+                        yield from self._render_workflow_card(workflow, env_name)
             else:
                 # Show environment URL/health/repo for non-workflow environments
+                env_url = env.url
+                env_repo = env.repo
                 # URL
                 with Horizontal(classes="info-row"):
                     yield Static("URL:", classes="info-label")
-                    if env.url:
-                        short_url = env.url.replace(".hotosm.org", "")
+                    if env_url:
+                        short_url = env_url.replace(".hotosm.org", "")
                         yield Static(short_url, classes="info-value link")
-                        yield Button("📋", id=f"copy-url-{env.name}", classes="copy-btn", variant="default")
+                        yield self._copy_button(
+                            Button("📋", id=f"copy-url-{env_name}", classes="copy-btn", variant="default"),
+                            env.full_url,
+                            "URL copied!",
+                        )
                     else:
                         yield Static("Not deployed", classes="info-value")
 
                 # Health check
-                if env.url:
-                    with Horizontal(classes="info-row"):
-                        yield Static("Health:", classes="info-label")
-                        yield Static("⏳ Checking...", id=f"health-{env.name}", classes="info-value status-loading")
+                if env_url:
+                    yield self._health_row(f"health-{env_name}", env)
 
                 # Repo/Branch
-                if env.repo:
+                if env_repo:
                     with Horizontal(classes="info-row"):
                         yield Static("Repo:", classes="info-label")
-                        yield Static(env.repo, classes="info-value link")
-                        yield Button("📋", id=f"copy-repo-{env.name}", classes="copy-btn", variant="default")
+                        yield Static(env_repo, classes="info-value link")
+                        yield self._copy_button(
+                            Button("📋", id=f"copy-repo-{env_name}", classes="copy-btn", variant="default"),
+                            env.repo_url,
+                            "Repository URL copied!",
+                        )
 
-                    with Horizontal(classes="info-row"):
-                        yield Static("Branch:", classes="info-label")
-                        yield Static(env.branch, classes="info-value")
+                    yield InfoRow("Branch:", env.branch, classes="info-value")
 
                 # Show environment status
                 yield from self._render_status_info(env)
 
     def _render_status_info(self, env: Environment) -> ComposeResult:
         """Render status info for an environment."""
-        status_icon = get_status_icon(env.status)
-        status_class = f"status-{env.status.value}"
-
-        with Horizontal(classes="info-row"):
-            yield Static("Status:", classes="info-label")
-            yield Static(f"{status_icon} {env.status.value.upper()}", classes=f"info-value {status_class}")
+        yield self._field(f"status-{env.name}", "Status:")
 
         if env.time:
-            with Horizontal(classes="info-row"):
-                yield Static("Last run:", classes="info-label")
-                time_ago = humanize.naturaltime(env.time, when=datetime.now(timezone.utc))
-                yield Static(time_ago, classes="info-value")
+            yield self._field(f"time-{env.name}", "Last run:")
 
         if env.actor:
-            with Horizontal(classes="info-row"):
-                yield Static("Triggered by:", classes="info-label")
-                yield Static(f"@{env.actor}", classes="info-value actor")
+            yield self._field(f"actor-{env.name}", "Triggered by:")
 
         if env.duration_seconds:
-            with Horizontal(classes="info-row"):
-                yield Static("Duration:", classes="info-label")
-                duration = humanize.naturaldelta(env.duration_seconds)
-                yield Static(duration, classes="info-value")
+            yield self._field(f"duration-{env.name}", "Duration:")
 
         # Error logs
         if env.status == Status.FAILURE and env.error_lines:
@@ -574,11 +707,10 @@ class DetailView(Static):
 
     def _render_workflow_card(self, workflow: Workflow, env_name: str = "") -> ComposeResult:
         """Render a workflow as a card."""
-        status_icon = get_status_icon(workflow.status)
-        status_class = workflow.status.value
-        card_id = f"{env_name}-{workflow.display_name}".replace(" ", "-")
+        card_id = _workflow_key(env_name, workflow)
 
-        with Vertical(classes=f"workflow-card {status_class}"):
+        with Vertical(classes=self._values[f"card-{card_id}"][1]) as card:
+            self._fields[f"card-{card_id}"] = card
             yield Static(f"{workflow.icon} {workflow.display_name}", classes="workflow-card-title")
 
             # URL (show short version, full URL available via 'u' key)
@@ -589,228 +721,151 @@ class DetailView(Static):
                     yield Static(short_url, classes="info-value link")
 
                 # Health check
-                with Horizontal(classes="info-row"):
-                    yield Static("Health:", classes="info-label")
-                    yield Static("⏳ Checking...", id=f"health-wf-{card_id}", classes="info-value status-loading")
+                yield self._health_row(f"health-wf-{card_id}", workflow)
 
             # Branch
             if workflow.branch:
-                with Horizontal(classes="info-row"):
-                    yield Static("Branch:", classes="info-label")
-                    yield Static(workflow.branch, classes="info-value")
+                yield InfoRow("Branch:", workflow.branch, classes="info-value")
 
             # Status
-            with Horizontal(classes="info-row"):
-                yield Static("Build:", classes="info-label")
-                yield Static(f"{status_icon} {workflow.status.value.upper()}", classes=f"info-value status-{workflow.status.value}")
+            yield self._field(f"status-{card_id}", "Build:")
 
             if workflow.time:
-                time_ago = humanize.naturaltime(workflow.time, when=datetime.now(timezone.utc))
-                with Horizontal(classes="info-row"):
-                    yield Static("Last run:", classes="info-label")
-                    yield Static(time_ago, classes="info-value")
+                yield self._field(f"time-{card_id}", "Last run:")
 
             if workflow.actor:
-                with Horizontal(classes="info-row"):
-                    yield Static("By:", classes="info-label")
-                    yield Static(f"@{workflow.actor}", classes="info-value actor")
+                yield self._field(f"actor-{card_id}", "By:")
 
             if workflow.status == Status.FAILURE and workflow.error_lines:
                 yield from self._render_error_section(workflow.error_lines, f"{env_name}-{workflow.name}", workflow.repo, workflow.run_id, workflow.job_id)
 
-    def _render_workflow_info(self, workflow: Workflow, env_name: str = "") -> ComposeResult:
-        """Render info for a workflow (legacy vertical style)."""
-        status_icon = get_status_icon(workflow.status)
-        status_class = f"status-{workflow.status.value}"
-
-        with Horizontal(classes="info-row"):
-            yield Static(f"  {workflow.icon}", classes="info-label")
-            yield Static(f"{workflow.display_name}: {status_icon} {workflow.status.value.upper()}", classes=f"info-value {status_class}")
-
-        if workflow.time:
-            time_ago = humanize.naturaltime(workflow.time, when=datetime.now(timezone.utc))
-            actor_info = f" by @{workflow.actor}" if workflow.actor else ""
-            with Horizontal(classes="info-row"):
-                yield Static("", classes="info-label")
-                yield Static(f"Last run: {time_ago}{actor_info}", classes="info-value")
-
-        if workflow.status == Status.FAILURE and workflow.error_lines:
-            yield from self._render_error_section(workflow.error_lines, f"{env_name}-{workflow.name}", workflow.repo, workflow.run_id, workflow.job_id)
-
-    def _render_commit_info(self, commit: Commit) -> ComposeResult:
-        """Render commit info section."""
-        with Vertical(classes="commit-section"):
-            yield Static("Last Commit:", classes="commit-title")
-            with Horizontal(classes="info-row"):
-                yield Static("SHA:", classes="info-label")
-                yield Static(commit.sha, classes="info-value commit-sha")
-            with Horizontal(classes="info-row"):
-                yield Static("Message:", classes="info-label")
-                yield Static(commit.message, classes="info-value")
-            with Horizontal(classes="info-row"):
-                yield Static("Author:", classes="info-label")
-                yield Static(commit.author, classes="info-value")
-            if commit.date:
-                time_ago = humanize.naturaltime(commit.date, when=datetime.now(timezone.utc))
-                with Horizontal(classes="info-row"):
-                    yield Static("Date:", classes="info-label")
-                    yield Static(time_ago, classes="info-value")
-
     def _render_env_commit(self, env: Environment) -> ComposeResult:
         """Render compact commit info for an environment."""
         commit = env.last_commit
         if not commit:
             return
 
-        time_ago = ""
-        if commit.date:
-            time_ago = humanize.naturaltime(commit.date, when=datetime.now(timezone.utc))
-
-        with Horizontal(classes="env-commit-row"):
-            yield Static(f"{env.name}:", classes="env-commit-label")
-            yield Static(commit.sha, classes="commit-sha-small")
-            yield Static(commit.message[:30], classes="commit-msg-short")
-            yield Static(time_ago, classes="commit-time")
+        key = f"commit-time-{env.name}"
+        time_text, classes = self._values[key]
+        row = CommitRow(f"{env.name}:", commit, time_text, classes=classes)
+        self._fields[key] = row
+        yield row
 
     def _render_comparisons(self) -> ComposeResult:
         """Render branch comparisons."""
-        for i, (config, comparison) in enumerate(zip(self.app_data.compare_configs, self.app_data.comparisons)):
+        app = self.app_data
+        configs = app.compare_configs
+        comparisons = app.comparisons
+        for config, comparison in zip(configs, comparisons):
             yield Static(f"{config.head} → {config.base}:", classes="comparison-label")
 
             # Clear explanation of what needs to happen
-            if comparison.ahead_by > 0:
-                ahead_msg = f"  📤 {comparison.ahead_by} commits para mergear"
+            ahead_by = comparison.ahead_by
+            if ahead_by > 0:
+                ahead_msg = f"  📤 {ahead_by} commits para mergear"
                 yield Static(ahead_msg, classes="stat stat-warn")
             else:
                 yield Static(f"  ✓ Al día", classes="stat stat-good")
 
-            if comparison.behind_by > 0:
-                behind_msg = f"  📥 {comparison.behind_by} commits atrás"
+            behind_by = comparison.behind_by
+            if behind_by > 0:
+                behind_msg = f"  📥 {behind_by} commits atrás"
                 yield Static(behind_msg, classes="stat stat-warn")
 
-            # Recent commits to merge (if any)
-            if comparison.commits:
+            # Recent commits to merge (if any), as one widget. The fetch
+            # already keeps only the last COMPARE_COMMITS of them.
+            commits = comparison.commits
+            if commits:
                 yield Static(f"  Pendientes:", classes="commits-title")
-                for commit in comparison.commits[-5:]:
-                    with Horizontal(classes="commit-row"):
-                        yield Static(f"    {commit.sha}", classes="commit-sha-small")
-                        yield Static(commit.message[:35], classes="commit-msg")
+                yield Static(
+                    Text("\n").join(
+                        Text.assemble((f"    {commit.sha}", "yellow"), "  ", commit.message[:35])
+                        for commit in commits
+                    ),
+                    classes="commits-block",
+                )
 
     def _render_error_section(self, error_lines: list[str], env_name: str = "", repo: str = "", run_id: int = None, job_id: int = None) -> ComposeResult:
-        """Render error log section with link to GitHub."""
+        """Render error log section with link to GitHub and the log to copy."""
         if repo and run_id:
             # Link directly to the failed job if we have job_id
             if job_id:
                 url = f"https://github.com/{repo}/actions/runs/{run_id}/job/{job_id}"
             else:
                 url = f"https://github.com/{repo}/actions/runs/{run_id}"
-            # Store URL for copy button
-            self._error_urls = getattr(self, '_error_urls', {})
-            self._error_urls[env_name] = url
+            # Workflow names can contain spaces, dots, "&" etc., which aren't
+            # allowed in widget IDs
+            key = _INVALID_ID_CHARS.sub("_", env_name)
 
-            with Horizontal(classes="info-row"):
-                yield Static("Error:", classes="info-label")
-                yield Static(f"❌ Build failed", classes="info-value status-failure")
+            yield InfoRow("Error:", f"❌ Build failed", classes="info-value status-failure")
             with Horizontal(classes="info-row"):
                 yield Static("", classes="info-label")
-                yield Button.error("Copy error link", id=f"copy-error-url-{env_name}")
+                yield self._copy_button(Button.error("Copy error link", id=f"copy-error-url-{key}"), url, "Error link copied!")
+                yield self._copy_button(Button.error("Copy error log", id=f"copy-error-log-{key}"), "\n".join(error_lines), "Error log copied!")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
-        btn_id = event.button.id or ""
-
+        btn_id = event.button.id
         if btn_id == "close-btn":
             self.post_message(self.CloseRequested())
-        elif btn_id.startswith("copy-url-"):
-            env_name = btn_id.replace("copy-url-", "")
-            env = self.app_data.dev if env_name == "DEV" else self.app_data.prod
-            if env.url:
-                if copy_to_clipboard(f"https://{env.url}"):
-                    self.notify("URL copied!")
-                else:
-                    self.notify("Install xclip: sudo apt install xclip", severity="warning")
-        elif btn_id.startswith("copy-repo-"):
-            env_name = btn_id.replace("copy-repo-", "")
-            env = self.app_data.dev if env_name == "DEV" else self.app_data.prod
-            if env.repo:
-                if copy_to_clipboard(f"https://github.com/{env.repo}"):
-                    self.notify("Repository URL copied!")
-                else:
-                    self.notify("Install xclip: sudo apt install xclip", severity="warning")
-        elif btn_id.startswith("copy-error-url-"):
-            env_name = btn_id.replace("copy-error-url-", "")
-            error_urls = getattr(self, '_error_urls', {})
-            if env_name in error_urls:
-                if copy_to_clipboard(error_urls[env_name]):
-                    self.notify("Error link copied!")
-                else:
-                    self.notify("Install xclip: sudo apt install xclip", severity="warning")
-        elif btn_id.startswith("copy-error-"):
-            error_id = btn_id.replace("copy-error-", "")
-            error_lines = []
-            # Check if it's a workflow error (format: ENV-workflow_name)
-            if error_id.startswith("DEV-") or error_id.startswith("PROD-"):
-                env_name = error_id.split("-")[0]
-                workflow_name = error_id[len(env_name)+1:]
-                env = self.app_data.dev if env_name == "DEV" else self.app_data.prod
-                for wf in env.workflows:
-                    if wf.name == workflow_name:
-                        error_lines = wf.error_lines
-                        break
-            else:
-                # Direct environment error
-                env = self.app_data.dev if error_id == "DEV" else self.app_data.prod
-                error_lines = env.error_lines
-
-            if error_lines:
-                if copy_to_clipboard("\n".join(error_lines)):
-                    self.notify("Error log copied!")
-                else:
-                    self.notify("Install xclip: sudo apt install xclip", severity="warning")
-        elif btn_id.startswith("open-error-"):
-            # Open GitHub Actions run for the failed build
-            error_id = btn_id.replace("open-error-", "")
-            repo = None
-            run_id = None
-
-            if error_id.startswith("DEV-") or error_id.startswith("PROD-"):
-                env_name = error_id.split("-")[0]
-                workflow_name = error_id[len(env_name)+1:]
-                env = self.app_data.dev if env_name == "DEV" else self.app_data.prod
-                for wf in env.workflows:
-                    if wf.name == workflow_name:
-                        repo = wf.repo
-                        run_id = wf.run_id
-                        break
-            else:
-                env = self.app_data.dev if error_id == "DEV" else self.app_data.prod
-                repo = env.repo
-                run_id = env.run_id
-
-            if repo and run_id:
-                import webbrowser
-                url = f"https://github.com/{repo}/actions/runs/{run_id}"
-                webbrowser.open(url)
+            return
 
-    def _update_health_display(self) -> None:
-        """Update the health status widgets."""
+        copy_target = self._copy_targets.get(btn_id)
+        if copy_target:
+            text, message = copy_target
+            # The clipboard tool can take a while (e.g. on X11), so keep it
+            # off the event loop
+            if await asyncio.to_thread(copy_to_clipboard, text):
+                self.notify(message)
+            else:
+                self.notify("Install xclip: sudo apt install xclip", severity="warning")
+
+    def _copy_button(self, button: Button, text: str, message: str) -> Button:
+        """Register what a copy button copies, for on_button_pressed."""
+        self._copy_targets[button.id] = (text, message)
+        return button
+
+    def _health_status(self, target: Environment | Workflow) -> tuple[str, Status]:
+        """Get the health text and the status it's styled as for an environment or workflow."""
+        if target.health_ok is None:
+            return "⏳ Checking...", Status.LOADING
+        if target.health_ok:
+            latency = f"{target.health_latency_ms}ms" if target.health_latency_ms else ""
+            return f"✓ {target.health_code} OK {latency}", Status.SUCCESS
+        error = target.health_error or f"HTTP {target.health_code}"
+        return f"✗ {error}", Status.FAILURE
+
+    def _health_row(self, widget_id: str, target: Environment | Workflow) -> InfoRow:
+        """Create the health row for an environment or workflow."""
+        shown = self._health_status(target)
+        self._health_shown[widget_id] = shown
+        text, status = shown
+        return InfoRow("Health:", text, id=widget_id, classes=_INFO_VALUE_CLASSES[status])
+
+    def _set_health(self, widget_id: str, target: Environment | Workflow) -> None:
+        """Update a health row's text and status class, if they changed."""
+        shown = self._health_status(target)
+        if self._health_shown.get(widget_id) == shown:
+            return
+        text, status = shown
+        widget = self.query_one(f"#{widget_id}", Static)
+        widget.update(text)
+        widget.remove_class(*_HEALTH_CLASSES)
+        widget.add_class(STATUS_CLASSES[status])
+        self._health_shown[widget_id] = shown
+
+    def update_health_display(self) -> None:
+        """Update the health status widgets.
+
+        The app runs the health checks (with each refresh) and calls this
+        when they finish for the app shown here.
+        """
         # Update environment health (only for envs without workflows)
         for env in [self.app_data.dev, self.app_data.prod]:
             if not env.url or env.has_workflows:
                 continue
             try:
-                widget = self.query_one(f"#health-{env.name}", Static)
-                if env.health_ok is None:
-                    widget.update("⏳ Checking...")
-                    widget.set_classes("info-value status-loading")
-                elif env.health_ok:
-                    latency = f"{env.health_latency_ms}ms" if env.health_latency_ms else ""
-                    widget.update(f"✓ {env.health_code} OK {latency}")
-                    widget.set_classes("info-value status-success")
-                else:
-                    error = env.health_error or f"HTTP {env.health_code}"
-                    widget.update(f"✗ {error}")
-                    widget.set_classes("info-value status-failure")
+                self._set_health(f"health-{env.name}", env)
             except Exception:
                 pass
 
@@ -819,24 +874,39 @@ class DetailView(Static):
             for workflow in env.workflows:
                 if not workflow.url:
                     continue
-                card_id = f"{env.name}-{workflow.display_name}".replace(" ", "-")
+                card_id = _workflow_key(env.name, workflow)
                 try:
-                    widget = self.query_one(f"#health-wf-{card_id}", Static)
-                    if workflow.health_ok is None:
-                        widget.update("⏳ Checking...")
-                        widget.set_classes("info-value status-loading")
-                    elif workflow.health_ok:
-                        latency = f"{workflow.health_latency_ms}ms" if workflow.health_latency_ms else ""
-                        widget.update(f"✓ {workflow.health_code} OK {latency}")
-                        widget.set_classes("info-value status-success")
-                    else:
-                        error = workflow.health_error or f"HTTP {workflow.health_code}"
-                        widget.update(f"✗ {error}")
-                        widget.set_classes("info-value status-failure")
+                    self._set_health(f"health-wf-{card_id}", workflow)
                 except Exception:
                     pass
 
     def update_app(self, app: App) -> None:
         """Update with new app data."""
         self.app_data = app
-        self.refresh(recompose=True)
+        # Only recompose when rows appear or disappear; otherwise just
+        # update the widgets whose text or classes changed
+        fp = _fingerprint(app)
+        if fp != self._last_fp:
+            self._last_fp = fp
+            self.refresh(recompose=True)
+        else:
+            self._patch(_field_values(app, _now_bucket()))
+
+    def _field(self, key: str, label: str) -> InfoRow:
+        """Create an InfoRow for a value from _field_values, and keep it for patching."""
+        text, classes = self._values[key]
+        widget = InfoRow(label, text, classes=classes)
+        self._fields[key] = widget
+        return widget
+
+    def _patch(self, values: dict[str, tuple[Optional[str], str]]) -> None:
+        """Update the composed widgets whose values changed."""
+        for key, value in values.items():
+            widget = self._fields.get(key)
+            if widget is None or value == self._values.get(key):
+                continue
+            text, classes = value
+            if text is not None:
+                widget.update(text)
+            widget.set_classes(classes)
+        self._values = values